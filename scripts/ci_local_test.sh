@@ -70,7 +70,7 @@ fi
 # Quick link check
 echo ""
 echo "🔗 Checking for obvious broken links..."
-broken_count=$(find book -name "*.html" -type f -exec grep -l "404" {} \; 2>/dev/null | wc -l)
+broken_count=$(grep -rl --include="*.html" "404" book 2>/dev/null | wc -l)
 if [ "$broken_count" -gt 0 ]; then
     echo "⚠️  Some files contain '404' - might have broken links"
 else